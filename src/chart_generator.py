@@ -3,35 +3,229 @@ Chart Generation Module
 Creates matplotlib charts and handles chart embedding into Excel files.
 """
 
+import matplotlib
+# Reports are always rendered off-screen; forcing Agg before pyplot is
+# imported avoids pulling in an interactive GUI backend on servers
+matplotlib.use('Agg', force=True)
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.ticker import FuncFormatter
+
+plt.ioff()
+
+# Fast-path settings for large line plots
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
 import pandas as pd
 import numpy as np
 from io import BytesIO
+from PIL import Image as PILImage, ImageDraw, ImageFont
 import base64
+import concurrent.futures
+import functools
+import math
+import os
 from datetime import datetime
 
+# Shared axis formatters - built once at import instead of per chart call
+_CURRENCY_FMT = FuncFormatter(lambda x, p: f'${x:,.0f}')
+_FLOAT_FMT = FuncFormatter(lambda x, p: f'{x:.1f}')
+
+@functools.lru_cache(maxsize=32)
+def _product_chart_layout(n_products, currency):
+    """
+    Precompute shape-dependent constants for the product chart.
+
+    Batch runs render the same (n_products, currency) shapes repeatedly,
+    so the figure size, bar positions and axis formatter are baked once
+    per distinct shape instead of being recomputed per call.
+
+    Args:
+        n_products (int): Number of bars in the chart
+        currency (bool): Whether values format as currency
+
+    Returns:
+        dict: figsize, bar positions and formatter for this shape
+    """
+    return {
+        'figsize': (12, max(8, n_products * 0.6)),
+        'positions': range(n_products),
+        'formatter': _CURRENCY_FMT if currency else _FLOAT_FMT,
+    }
+
+def _load_font(size, bold=True):
+    """
+    Load a TrueType font for PIL rendering.
+
+    Uses the DejaVu fonts bundled with matplotlib so output is
+    consistent across platforms; falls back to PIL's built-in font.
+
+    Args:
+        size (int): Font size in pixels
+        bold (bool): Use the bold variant
+
+    Returns:
+        ImageFont: Loaded font object
+    """
+    name = 'DejaVuSans-Bold.ttf' if bold else 'DejaVuSans.ttf'
+    try:
+        font_path = os.path.join(matplotlib.get_data_path(), 'fonts', 'ttf', name)
+        return ImageFont.truetype(font_path, size)
+    except Exception:
+        return ImageFont.load_default()
+
+# Maps chart names to the ChartGenerator method that renders them
+_CHART_METHODS = {
+    'monthly_trend': 'create_monthly_trend_chart',
+    'product_performance': 'create_product_performance_chart',
+    'regional_distribution': 'create_regional_pie_chart',
+    'summary_dashboard': 'create_summary_dashboard',
+}
+
+def _render_chart_task(chart_name, data, dpi):
+    """
+    Render a single chart in a worker process.
+
+    Each worker builds its own ChartGenerator (matplotlib is not
+    thread-safe, so charts are parallelized across processes) and
+    returns raw PNG bytes since BytesIO objects do not pickle.
+
+    Args:
+        chart_name (str): Key into _CHART_METHODS
+        data: Aggregated dataset (DataFrame or summary dict)
+        dpi (int): Output resolution
+
+    Returns:
+        bytes: Encoded PNG, or None if the chart was skipped
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+
+    generator = ChartGenerator(dpi=dpi)
+    result = getattr(generator, _CHART_METHODS[chart_name])(data)
+    return result.getvalue() if result is not None else None
+
 class ChartGenerator:
     """Generates various types of charts for Excel reports."""
     
-    def __init__(self, style='seaborn-v0_8', figsize=(12, 8)):
+    def __init__(self, style='seaborn-v0_8', figsize=(12, 8), dpi=100):
         """
         Initialize chart generator with styling options.
-        
+
         Args:
             style (str): Matplotlib style to use
             figsize (tuple): Default figure size
+            dpi (int): Output resolution; 100 is plenty for Excel-embedded
+                charts, pass 300 for print-quality output
         """
         self.figsize = figsize
+        self.dpi = dpi
         # Set style if available, otherwise use default
         try:
             plt.style.use(style)
-        except:
+        except (OSError, ValueError):
             plt.style.use('default')
         
         # Set color palette
         self.colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#593E2C', '#8338EC']
-        
+
+        # Fast PIL pie renderer; set False to fall back to matplotlib
+        self.use_fast_pie = True
+
+        # Cache of Figure/Axes pairs keyed by (name, nrows, ncols, figsize) so
+        # repeated report runs reuse figures instead of rebuilding them
+        self._fig_cache = {}
+
+        # Pool of released chart buffers; reusing them keeps their backing
+        # allocation and avoids realloc churn while PNG bytes are appended
+        self._buf_pool = []
+
+    def _get_buf(self):
+        """Get a pooled BytesIO buffer, or a fresh one when the pool is empty."""
+        if self._buf_pool:
+            buffer = self._buf_pool.pop()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return buffer
+        return BytesIO()
+
+    def release_buffers(self, charts):
+        """
+        Return chart buffers to the pool once a consumer is done with them.
+
+        Args:
+            charts (dict): Chart name to buffer mapping from generate_all_charts
+        """
+        for buffer in charts.values():
+            if isinstance(buffer, BytesIO):
+                self._buf_pool.append(buffer)
+
+    def _get_fig(self, name, nrows=1, ncols=1, figsize=None):
+        """
+        Get a cached Figure/Axes pair, creating it on first use.
+
+        Args:
+            name (str): Logical name of the chart (cache key component)
+            nrows (int): Number of subplot rows
+            ncols (int): Number of subplot columns
+            figsize (tuple): Figure size
+
+        Returns:
+            tuple: (Figure, Axes or array of Axes) with cleared axes
+        """
+        if figsize is None:
+            figsize = self.figsize
+
+        key = (name, nrows, ncols, figsize)
+        if key not in self._fig_cache:
+            self._fig_cache[key] = plt.subplots(nrows, ncols, figsize=figsize)
+        else:
+            fig, axes = self._fig_cache[key]
+            for ax in np.atleast_1d(axes).ravel():
+                ax.clear()
+
+        return self._fig_cache[key]
+
+    def _save(self, fig, save_path=None):
+        """
+        Save a figure as PNG to disk or to an in-memory buffer.
+
+        Uses a low zlib compression level - chart-style images barely
+        shrink at higher levels but encode several times slower.
+
+        Args:
+            fig: Figure to save
+            save_path (str): Path to save chart image, or None for a buffer
+
+        Returns:
+            str or BytesIO: Saved path, or buffer positioned at start
+        """
+        # The Agg canvas (and its renderer plus RGBA buffer) was bound to
+        # the figure when it entered the cache; reuse it rather than
+        # building a fresh renderer per save like plt.savefig does
+        canvas = fig.canvas
+        original_dpi = fig.dpi
+        fig.dpi = self.dpi
+        try:
+            if save_path:
+                canvas.print_png(save_path,
+                                 pil_kwargs={'compress_level': 1, 'optimize': False})
+                return save_path
+
+            # For the embed path, rasterize straight into the Agg RGBA
+            # buffer and encode it with PIL in one shot - skips savefig's
+            # incremental BytesIO writes and buffer reallocations
+            rgba, (width, height) = canvas.print_to_buffer()
+        finally:
+            fig.dpi = original_dpi
+
+        buffer = self._get_buf()
+        PILImage.frombuffer('RGBA', (width, height), rgba).save(
+            buffer, 'PNG', compress_level=1, optimize=False)
+        buffer.seek(0)
+        return buffer
+
     def create_monthly_trend_chart(self, monthly_data, save_path=None):
         """
         Create a monthly sales trend line chart.
@@ -45,9 +239,9 @@ class ChartGenerator:
         """
         if monthly_data.empty:
             return None
-            
-        fig, ax = plt.subplots(figsize=self.figsize)
-        
+
+        fig, ax = self._get_fig('monthly_trend')
+
         # Extract data
         months = monthly_data.iloc[:, 0]  # First column should be months
         sales = monthly_data.iloc[:, 1]   # Second column should be total sales
@@ -62,31 +256,20 @@ class ChartGenerator:
         ax.set_ylabel('Total Sales', fontsize=12, fontweight='bold')
         
         # Rotate x-axis labels for better readability
-        plt.xticks(rotation=45, ha='right')
-        
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+
         # Add grid
         ax.grid(True, alpha=0.3)
-        
+
         # Format y-axis as currency if values are large
         if sales.max() > 1000:
-            from matplotlib.ticker import FuncFormatter
-            ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'${x:,.0f}'))
-        
+            ax.yaxis.set_major_formatter(_CURRENCY_FMT)
+
         # Tight layout to prevent label cutoff
-        plt.tight_layout()
-        
+        fig.tight_layout()
+
         # Save chart
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            return save_path
-        else:
-            # Return as bytes for embedding
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-            buffer.seek(0)
-            plt.close()
-            return buffer
+        return self._save(fig, save_path)
     
     def create_product_performance_chart(self, product_data, save_path=None, top_n=10):
         """
@@ -105,57 +288,51 @@ class ChartGenerator:
             
         # Get top N products
         top_products = product_data.head(top_n)
-        
-        fig, ax = plt.subplots(figsize=(12, max(8, top_n * 0.6)))
-        
+
         # Extract data
         products = top_products.iloc[:, 0]  # First column should be products
         sales = top_products.iloc[:, 1]     # Second column should be sales
-        
+
+        # Shape-dependent constants come from the memoized layout
+        currency = bool(sales.max() > 1000)
+        layout = _product_chart_layout(len(top_products), currency)
+
+        fig, ax = self._get_fig('product_performance', figsize=layout['figsize'])
+
         # Create horizontal bar chart
-        bars = ax.barh(range(len(products)), sales, color=self.colors[0], alpha=0.8)
-        
+        bars = ax.barh(layout['positions'], sales, color=self.colors[0], alpha=0.8)
+
         # Formatting
         ax.set_title(f'Top {len(products)} Products by Sales', fontsize=16, fontweight='bold', pad=20)
         ax.set_xlabel('Total Sales', fontsize=12, fontweight='bold')
         ax.set_ylabel('Products', fontsize=12, fontweight='bold')
-        
+
         # Set product names as y-tick labels
-        ax.set_yticks(range(len(products)))
+        ax.set_yticks(layout['positions'])
         ax.set_yticklabels(products, fontsize=10)
-        
+
         # Add value labels on bars
         for i, bar in enumerate(bars):
             width = bar.get_width()
-            ax.text(width + width*0.01, bar.get_y() + bar.get_height()/2, 
-                   f'${width:,.0f}' if width > 1000 else f'{width:.1f}',
+            ax.text(width + width*0.01, bar.get_y() + bar.get_height()/2,
+                   f'${width:,.0f}' if currency else f'{width:.1f}',
                    ha='left', va='center', fontsize=9)
-        
+
         # Format x-axis as currency if values are large
-        if sales.max() > 1000:
-            from matplotlib.ticker import FuncFormatter
-            ax.xaxis.set_major_formatter(FuncFormatter(lambda x, p: f'${x:,.0f}'))
+        if currency:
+            ax.xaxis.set_major_formatter(layout['formatter'])
         
         # Add grid
         ax.grid(True, alpha=0.3, axis='x')
         
         # Invert y-axis to show highest values at top
         ax.invert_yaxis()
-        
-        plt.tight_layout()
-        
+
+        fig.tight_layout()
+
         # Save chart
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            return save_path
-        else:
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-            buffer.seek(0)
-            plt.close()
-            return buffer
-    
+        return self._save(fig, save_path)
+
     def create_regional_pie_chart(self, regional_data, save_path=None):
         """
         Create a pie chart for regional sales distribution.
@@ -169,24 +346,20 @@ class ChartGenerator:
         """
         if regional_data.empty:
             return None
-            
-        fig, ax = plt.subplots(figsize=(10, 10))
-        
+
         # Extract data
         regions = regional_data.iloc[:, 0]  # First column should be regions
         sales = regional_data.iloc[:, 1]    # Second column should be sales
-        
-        # Create pie chart
-        pie_result = ax.pie(sales, labels=regions, autopct='%1.1f%%',
-                           startangle=90, colors=self.colors[:len(regions)])
-        
-        # Handle different return formats from pie chart
-        if len(pie_result) == 3:
-            wedges, texts, autotexts = pie_result
-        else:
-            wedges, texts = pie_result
-            autotexts = []
-        
+
+        if self.use_fast_pie:
+            return self._create_pie_pil(regions, sales, save_path)
+
+        fig, ax = self._get_fig('regional_pie', figsize=(10, 10))
+
+        # Create pie chart (unpacks both tuple and PieContainer returns)
+        wedges, texts, autotexts = ax.pie(sales, labels=regions, autopct='%1.1f%%',
+                                          startangle=90, colors=self.colors[:len(regions)])
+
         # Formatting
         ax.set_title('Sales Distribution by Region', fontsize=16, fontweight='bold', pad=20)
         
@@ -198,121 +371,193 @@ class ChartGenerator:
         
         # Equal aspect ratio ensures that pie is drawn as a circle
         ax.axis('equal')
-        
-        plt.tight_layout()
-        
+
+        fig.tight_layout()
+
         # Save chart
+        return self._save(fig, save_path)
+
+    def _create_pie_pil(self, regions, sales, save_path=None):
+        """
+        Render the regional pie chart directly with PIL.
+
+        ImageDraw.pieslice rasterizes each wedge in one pass - none of
+        matplotlib's Bezier path or transform machinery, which is
+        overkill for an Excel-embedded summary chart.
+
+        Args:
+            regions: Region labels
+            sales: Sales values per region
+            save_path (str): Path to save chart image
+
+        Returns:
+            str or BytesIO: Saved path or buffer
+        """
+        values = np.asarray(sales, dtype=np.float64)
+        total = values.sum()
+        if total <= 0:
+            return None
+
+        size = 1000
+        img = PILImage.new('RGB', (size, size), 'white')
+        draw = ImageDraw.Draw(img)
+
+        title_font = _load_font(36)
+        label_font = _load_font(20, bold=False)
+        pct_font = _load_font(22)
+
+        draw.text((size // 2, 45), 'Sales Distribution by Region',
+                  fill='black', anchor='mm', font=title_font)
+
+        center = size / 2
+        radius = (size - 360) / 2
+        bbox = (center - radius, center - radius, center + radius, center + radius)
+
+        fracs = values / total
+        start = -90.0  # start at 12 o'clock like matplotlib's startangle=90
+        for i, (region, frac) in enumerate(zip(regions, fracs)):
+            end = start + frac * 360.0
+            draw.pieslice(bbox, start, end,
+                          fill=self.colors[i % len(self.colors)],
+                          outline='white', width=2)
+
+            mid = math.radians((start + end) / 2)
+            # Percentage inside the wedge, label just outside it
+            if frac >= 0.02:
+                draw.text((center + 0.6 * radius * math.cos(mid),
+                           center + 0.6 * radius * math.sin(mid)),
+                          f'{frac * 100:.1f}%', fill='white', anchor='mm', font=pct_font)
+            draw.text((center + 1.08 * radius * math.cos(mid),
+                       center + 1.08 * radius * math.sin(mid)),
+                      str(region), fill='black',
+                      anchor='lm' if math.cos(mid) >= 0 else 'rm', font=label_font)
+            start = end
+
+        return self._save_pil(img, save_path)
+
+    def _save_pil(self, img, save_path=None):
+        """
+        Save a PIL image to disk or a pooled buffer, mirroring _save.
+
+        Args:
+            img: PIL image to save
+            save_path (str): Path to save chart image, or None for a buffer
+
+        Returns:
+            str or BytesIO: Saved path, or buffer positioned at start
+        """
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            img.save(save_path, 'PNG', compress_level=1, optimize=False)
             return save_path
-        else:
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-            buffer.seek(0)
-            plt.close()
-            return buffer
-    
+
+        buffer = self._get_buf()
+        img.save(buffer, 'PNG', compress_level=1, optimize=False)
+        buffer.seek(0)
+        return buffer
+
     def create_summary_dashboard(self, summary_stats, save_path=None):
         """
         Create a summary dashboard with key metrics.
-        
+
+        Rendered directly with PIL rather than matplotlib: the dashboard
+        is just text and border rectangles, so skipping the whole
+        Figure/Axes/renderer machinery makes this near-instant.
+
         Args:
             summary_stats (dict): Summary statistics
             save_path (str): Path to save chart image
-            
+
         Returns:
             str: Path to saved chart or None
         """
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-        
-        # Remove axes for text-based dashboard
-        for ax in [ax1, ax2, ax3, ax4]:
-            ax.axis('off')
-        
-        # Metric 1: Total Records
-        ax1.text(0.5, 0.5, f"{summary_stats.get('total_records', 'N/A'):,}", 
-                ha='center', va='center', fontsize=48, fontweight='bold', 
-                color=self.colors[0], transform=ax1.transAxes)
-        ax1.text(0.5, 0.2, 'Total Records', ha='center', va='center', 
-                fontsize=16, transform=ax1.transAxes)
-        
-        # Metric 2: Total Sales
+        width, height = 1600, 1200
+        img = PILImage.new('RGB', (width, height), 'white')
+        draw = ImageDraw.Draw(img)
+
+        value_font = _load_font(64)
+        small_value_font = _load_font(36)
+        label_font = _load_font(24, bold=False)
+        title_font = _load_font(40)
+
+        # Metric values use the same formatting rules as before
         total_sales = summary_stats.get('total_sales', 0)
         sales_text = f"${total_sales:,.0f}" if total_sales and total_sales > 1000 else str(total_sales or 'N/A')
-        ax2.text(0.5, 0.5, sales_text, ha='center', va='center', 
-                fontsize=48, fontweight='bold', color=self.colors[1], 
-                transform=ax2.transAxes)
-        ax2.text(0.5, 0.2, 'Total Sales', ha='center', va='center', 
-                fontsize=16, transform=ax2.transAxes)
-        
-        # Metric 3: Average Sale
         avg_sale = summary_stats.get('average_sale', 0)
         avg_text = f"${avg_sale:.2f}" if avg_sale else 'N/A'
-        ax3.text(0.5, 0.5, avg_text, ha='center', va='center', 
-                fontsize=48, fontweight='bold', color=self.colors[2], 
-                transform=ax3.transAxes)
-        ax3.text(0.5, 0.2, 'Average Sale', ha='center', va='center', 
-                fontsize=16, transform=ax3.transAxes)
-        
-        # Metric 4: Date Range
-        date_range = summary_stats.get('date_range', 'N/A')
-        ax4.text(0.5, 0.5, date_range, ha='center', va='center', 
-                fontsize=24, fontweight='bold', color=self.colors[3], 
-                transform=ax4.transAxes)
-        ax4.text(0.5, 0.2, 'Data Period', ha='center', va='center', 
-                fontsize=16, transform=ax4.transAxes)
-        
-        # Add borders around each metric
-        from matplotlib.patches import Rectangle
-        for ax in [ax1, ax2, ax3, ax4]:
-            rect = Rectangle((0.05, 0.05), 0.9, 0.9, linewidth=2, 
-                           edgecolor=self.colors[0], facecolor='none', 
-                           transform=ax.transAxes)
-            ax.add_patch(rect)
-        
-        plt.suptitle('Sales Summary Dashboard', fontsize=20, fontweight='bold', y=0.95)
-        plt.tight_layout()
-        
-        # Save chart
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            return save_path
-        else:
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-            buffer.seek(0)
-            plt.close()
-            return buffer
-    
-    def generate_all_charts(self, aggregations, output_dir='.'):
+
+        metrics = [
+            (f"{summary_stats.get('total_records', 0):,}", 'Total Records', self.colors[0], value_font),
+            (sales_text, 'Total Sales', self.colors[1], value_font),
+            (avg_text, 'Average Sale', self.colors[2], value_font),
+            (str(summary_stats.get('date_range', 'N/A')), 'Data Period', self.colors[3], small_value_font),
+        ]
+
+        # One metric per quadrant: value centered, label underneath,
+        # thin border inset from the quadrant edges
+        quad_w, quad_h = width // 2, (height - 100) // 2
+        draw.text((width // 2, 50), 'Sales Summary Dashboard',
+                  fill='black', anchor='mm', font=title_font)
+
+        for i, (value_text, label, color, font) in enumerate(metrics):
+            x0 = (i % 2) * quad_w
+            y0 = 100 + (i // 2) * quad_h
+            cx = x0 + quad_w // 2
+            draw.rectangle((x0 + 40, y0 + 30, x0 + quad_w - 40, y0 + quad_h - 30),
+                           outline=self.colors[0], width=3)
+            draw.text((cx, y0 + quad_h // 2 - 30), value_text,
+                      fill=color, anchor='mm', font=font)
+            draw.text((cx, y0 + quad_h - 90), label,
+                      fill='black', anchor='mm', font=label_font)
+
+        return self._save_pil(img, save_path)
+
+    def generate_all_charts(self, aggregations, output_dir='.', high_quality=False):
         """
         Generate all available charts based on aggregation data.
-        
+
         Args:
             aggregations (dict): All aggregated datasets
             output_dir (str): Directory to save charts
-            
+            high_quality (bool): Render at 300 DPI (e.g. for print output)
+
         Returns:
             dict: Dictionary of chart paths/buffers
         """
         charts = {}
-        
-        # Monthly trend chart
-        if 'monthly' in aggregations and not aggregations['monthly'].empty:
-            charts['monthly_trend'] = self.create_monthly_trend_chart(aggregations['monthly'])
-        
-        # Product performance chart
-        if 'product' in aggregations and not aggregations['product'].empty:
-            charts['product_performance'] = self.create_product_performance_chart(aggregations['product'])
-        
-        # Regional pie chart
-        if 'regional' in aggregations and not aggregations['regional'].empty:
-            charts['regional_distribution'] = self.create_regional_pie_chart(aggregations['regional'])
-        
-        # Summary dashboard
+        original_dpi = self.dpi
+        if high_quality:
+            self.dpi = 300
+        
+        # Each chart is an independent render pipeline, so dispatch them
+        # across worker processes (matplotlib is not thread-safe)
+        tasks = []
+        for chart_name, agg_key in [('monthly_trend', 'monthly'),
+                                    ('product_performance', 'product'),
+                                    ('regional_distribution', 'regional')]:
+            if agg_key in aggregations and not aggregations[agg_key].empty:
+                tasks.append((chart_name, aggregations[agg_key]))
+
         if 'summary' in aggregations:
-            charts['summary_dashboard'] = self.create_summary_dashboard(aggregations['summary'])
-        
+            tasks.append(('summary_dashboard', aggregations['summary']))
+
+        try:
+            if len(tasks) > 1:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+                    futures = {chart_name: executor.submit(_render_chart_task, chart_name, data, self.dpi)
+                               for chart_name, data in tasks}
+                    for chart_name, future in futures.items():
+                        png_bytes = future.result()
+                        charts[chart_name] = BytesIO(png_bytes) if png_bytes is not None else None
+            else:
+                for chart_name, data in tasks:
+                    charts[chart_name] = getattr(self, _CHART_METHODS[chart_name])(data)
+        except Exception:
+            # Fall back to sequential rendering in environments where
+            # worker processes cannot be spawned
+            for chart_name, data in tasks:
+                if chart_name not in charts:
+                    charts[chart_name] = getattr(self, _CHART_METHODS[chart_name])(data)
+        finally:
+            self.dpi = original_dpi
+
         return charts
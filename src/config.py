@@ -4,6 +4,7 @@ Contains configuration settings and constants for the report generator.
 """
 
 import os
+import re
 from datetime import datetime
 
 class Config:
@@ -19,6 +20,17 @@ class Config:
         self.MAX_PRODUCT_DISPLAY = 20
         self.DATE_FORMAT = "%Y-%m-%d"
         self.DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+        # Files larger than this are read in chunks of CHUNK_ROWS rows
+        # instead of one monolithic read_csv call
+        self.CHUNK_THRESHOLD_BYTES = 500 * 1024 * 1024
+        self.CHUNK_ROWS = 500_000
+
+        # Key columns for duplicate pre-filtering; when at least two are
+        # present, only rows matching on this subset are compared in
+        # full, instead of hashing every cell of every row ('date'
+        # covers the renamed sale_date after column standardization)
+        self.DEDUP_KEYS = ['block', 'lot', 'sale_date', 'date', 'borough']
         
         # Excel formatting settings
         self.HEADER_COLOR = "2E86AB"
@@ -36,7 +48,13 @@ class Config:
         # Data validation settings
         self.MIN_RECORDS_FOR_ANALYSIS = 1
         self.MAX_MISSING_DATA_PERCENT = 50
-        
+
+        # Precompiled alternation regexes for column classification - one
+        # regex scan per column name instead of a substring test per keyword
+        self._numeric_re = re.compile('|'.join(map(re.escape, self.numeric_columns_keywords)))
+        self._date_re = re.compile('|'.join(map(re.escape, self.date_columns_keywords)))
+        self._category_re = re.compile('|'.join(map(re.escape, self.category_columns_keywords)))
+
     def get_timestamped_filename(self, base_name=None, extension=".xlsx"):
         """
         Generate a timestamped filename.
@@ -69,6 +87,27 @@ class Config:
     def ensure_chart_directory(self):
         """Ensure chart directory exists."""
         os.makedirs(self.CHART_DIR, exist_ok=True)
+
+    def classify_column(self, name):
+        """
+        Classify a column name by its likely content.
+
+        Args:
+            name (str): Column name
+
+        Returns:
+            str: One of 'date', 'numeric', 'category', or None if unmatched
+        """
+        # Numeric keywords win ties: 'sale price' should classify as
+        # numeric even though 'sale' also appears in the date keywords
+        lowered = name.lower()
+        if self._numeric_re.search(lowered):
+            return 'numeric'
+        if self._date_re.search(lowered):
+            return 'date'
+        if self._category_re.search(lowered):
+            return 'category'
+        return None
     
     @property
     def supported_date_formats(self):
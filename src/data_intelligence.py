@@ -6,76 +6,184 @@ Smart detection of data types and automatic business intelligence insights.
 import pandas as pd
 import numpy as np
 from collections import Counter
+from types import SimpleNamespace
 import re
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from scipy.stats import skew as _scipy_skew
+except ImportError:
+    _scipy_skew = None
+
+# Strips thousands separators and whitespace from price strings in one pass
+_PRICE_CLEAN_RE = re.compile(r'[,\s]')
+
+def _monthly_trend_kernel(sales):
+    """
+    Single-pass kernel over monthly sales values.
+
+    Returns (argmax, argmin, recent_avg, earlier_avg) where the averages
+    cover the last/first three months. Compiled with numba when it is
+    installed; the plain-Python fallback runs the identical loop.
+    """
+    argmax = 0
+    argmin = 0
+    for i in range(1, sales.size):
+        if sales[i] > sales[argmax]:
+            argmax = i
+        if sales[i] < sales[argmin]:
+            argmin = i
+
+    n = sales.size
+    k = min(3, n)
+    recent = 0.0
+    earlier = 0.0
+    for i in range(k):
+        recent += sales[n - 1 - i]
+        earlier += sales[i]
+
+    return argmax, argmin, recent / k, earlier / k
+
+if njit is not None:
+    _monthly_trend_kernel = njit(cache=True)(_monthly_trend_kernel)
+
 class DataIntelligence:
     """Analyzes datasets to provide intelligent insights and recommendations."""
     
+    # Business domain keywords used for dataset classification
+    DOMAIN_KEYWORDS = {
+        'sales': ['sales', 'revenue', 'amount', 'price', 'product', 'customer', 'order', 'transaction'],
+        'real_estate': ['property', 'address', 'building', 'lot', 'square', 'feet', 'borough', 'neighborhood'],
+        'financial': ['balance', 'account', 'credit', 'debit', 'investment', 'portfolio', 'stock', 'bond'],
+        'hr': ['employee', 'salary', 'department', 'hire', 'performance', 'review'],
+        'marketing': ['campaign', 'click', 'impression', 'conversion', 'lead', 'funnel'],
+        'inventory': ['stock', 'warehouse', 'supplier', 'quantity', 'sku', 'category']
+    }
+
     def __init__(self, verbose=False):
         self.verbose = verbose
-        
+        # Keyword sets precomputed once so scoring is a set intersection
+        self._domain_sets = {domain: set(keywords)
+                             for domain, keywords in self.DOMAIN_KEYWORDS.items()}
+
     def detect_data_type(self, df):
         """
         Detect the primary business type of the dataset.
-        
+
         Args:
             df (pd.DataFrame): Input dataset
-            
+
         Returns:
             dict: Data type classification and confidence
         """
-        column_names = [col.lower() for col in df.columns]
-        column_text = ' '.join(column_names)
-        
-        # Define business domain keywords
-        domains = {
-            'sales': ['sales', 'revenue', 'amount', 'price', 'product', 'customer', 'order', 'transaction'],
-            'real_estate': ['property', 'address', 'building', 'lot', 'square', 'feet', 'borough', 'neighborhood'],
-            'financial': ['balance', 'account', 'credit', 'debit', 'investment', 'portfolio', 'stock', 'bond'],
-            'hr': ['employee', 'salary', 'department', 'hire', 'performance', 'review'],
-            'marketing': ['campaign', 'click', 'impression', 'conversion', 'lead', 'funnel'],
-            'inventory': ['stock', 'warehouse', 'supplier', 'quantity', 'sku', 'category']
-        }
-        
-        scores = {}
-        for domain, keywords in domains.items():
-            score = sum(1 for keyword in keywords if keyword in column_text)
-            scores[domain] = score
-        
+        # Tokenize column names once; each domain score is then an O(1)
+        # set intersection instead of repeated substring scans. Each
+        # token also contributes its trailing-s-stripped variant so
+        # singular keywords still match pluralized column names
+        # ('Products', 'Orders'), as the old substring scan did
+        column_text = ' '.join(col.lower() for col in df.columns)
+        tokens = set(re.findall(r'[a-z]+', column_text))
+        tokens |= {token[:-1] for token in tokens if token.endswith('s')}
+
+        scores = {domain: len(keyword_set & tokens)
+                  for domain, keyword_set in self._domain_sets.items()}
+
         # Find best match
         if scores:
             best_domain = max(scores.keys(), key=lambda x: scores[x])
-            confidence = scores[best_domain] / len(domains[best_domain]) * 100
+            confidence = scores[best_domain] / len(self._domain_sets[best_domain]) * 100
         else:
             best_domain = 'general'
             confidence = 0
-        
+
         return {
             'domain': best_domain,
             'confidence': min(confidence, 100),
             'all_scores': scores
         }
     
+    def _ensure_columnar(self, df):
+        """
+        Re-pack the numeric block of a dataframe in column-major order.
+
+        The insight helpers are all column-wise reductions (skew,
+        quantiles, correlations); when the backing array is C-ordered
+        each column read is strided across memory, so convert once up
+        front and every reduction scans contiguous cache lines.
+
+        Args:
+            df (pd.DataFrame): Input dataset
+
+        Returns:
+            pd.DataFrame: Dataset with Fortran-ordered numeric block
+        """
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) < 2:
+            return df
+
+        vals = df[numeric_cols].to_numpy()
+        if vals.ndim == 2 and not vals.flags['F_CONTIGUOUS']:
+            df[numeric_cols] = np.asfortranarray(vals)
+
+        return df
+
+    @staticmethod
+    def _build_context(aggregations):
+        """
+        Materialize the aggregation tables as plain numpy arrays once.
+
+        Each attribute pair is (labels, values) for a table, or None when
+        the table is absent or empty, so helpers can index arrays directly.
+
+        Args:
+            aggregations (dict): Data aggregations
+
+        Returns:
+            SimpleNamespace: Cached label/value arrays per aggregation
+        """
+        ctx = SimpleNamespace(monthly_labels=None, monthly_vals=None,
+                              product_labels=None, product_vals=None,
+                              regional_labels=None, regional_vals=None)
+
+        for key in ('monthly', 'product', 'regional'):
+            table = aggregations.get(key)
+            if table is not None and not table.empty:
+                setattr(ctx, f'{key}_labels', table.iloc[:, 0].to_numpy())
+                setattr(ctx, f'{key}_vals',
+                        table.iloc[:, 1].to_numpy(dtype=np.float64))
+
+        return ctx
+
     def generate_insights(self, df, aggregations, domain_info):
         """
         Generate intelligent business insights based on data analysis.
-        
+
         Args:
             df (pd.DataFrame): Processed dataset
             aggregations (dict): Data aggregations
             domain_info (dict): Domain detection results
-            
+
         Returns:
             list: List of business insights
         """
         insights = []
+        df = self._ensure_columnar(df)
         domain = domain_info['domain']
-        
+
+        # Extract numpy views of the aggregation tables once; the insight
+        # helpers then index raw arrays instead of re-dispatching .iloc
+        # chains over the same frames
+        ctx = self._build_context(aggregations)
+
         # Domain-specific insights
         if domain == 'sales':
-            insights.extend(self._generate_sales_insights(df, aggregations))
+            insights.extend(self._generate_sales_insights(df, aggregations, ctx))
         elif domain == 'real_estate':
-            insights.extend(self._generate_real_estate_insights(df, aggregations))
+            insights.extend(self._generate_real_estate_insights(df, aggregations, ctx))
         elif domain == 'financial':
             insights.extend(self._generate_financial_insights(df, aggregations))
         
@@ -84,52 +192,63 @@ class DataIntelligence:
         
         return insights
     
-    def _generate_sales_insights(self, df, aggregations):
+    def _generate_sales_insights(self, df, aggregations, ctx):
         """Generate sales-specific insights."""
         insights = []
-        
-        # Monthly trends
-        if 'monthly' in aggregations:
-            monthly = aggregations['monthly']
-            if not monthly.empty and len(monthly) > 1:
-                best_month = monthly.loc[monthly.iloc[:, 1].idxmax(), monthly.columns[0]]
-                worst_month = monthly.loc[monthly.iloc[:, 1].idxmin(), monthly.columns[0]]
-                insights.append(f"Peak sales month: {best_month}")
-                insights.append(f"Lowest sales month: {worst_month}")
-                
-                # Growth trend
-                if len(monthly) >= 3:
-                    recent_avg = monthly.iloc[-3:, 1].mean()
-                    earlier_avg = monthly.iloc[:3, 1].mean()
-                    if recent_avg > earlier_avg * 1.1:
-                        insights.append("Sales show strong growth trend in recent months")
-                    elif recent_avg < earlier_avg * 0.9:
-                        insights.append("Sales show declining trend - attention needed")
-        
+
+        # Monthly trends - one kernel pass replaces the chained
+        # idxmax/idxmin/mean pandas dispatches
+        if ctx.monthly_vals is not None and ctx.monthly_vals.size > 1:
+            argmax, argmin, recent_avg, earlier_avg = _monthly_trend_kernel(ctx.monthly_vals)
+            insights.append(f"Peak sales month: {ctx.monthly_labels[argmax]}")
+            insights.append(f"Lowest sales month: {ctx.monthly_labels[argmin]}")
+
+            # Growth trend
+            if ctx.monthly_vals.size >= 3:
+                if recent_avg > earlier_avg * 1.1:
+                    insights.append("Sales show strong growth trend in recent months")
+                elif recent_avg < earlier_avg * 0.9:
+                    insights.append("Sales show declining trend - attention needed")
+
         # Product analysis
-        if 'product' in aggregations:
-            products = aggregations['product']
-            if not products.empty:
-                top_product = products.iloc[0, 0]
-                top_revenue = products.iloc[0, 1]
-                insights.append(f"Star product '{top_product}' generates ${top_revenue:,.2f}")
-                
-                if len(products) > 5:
-                    top_5_revenue = products.iloc[:5, 1].sum()
-                    total_revenue = products.iloc[:, 1].sum()
-                    concentration = (top_5_revenue / total_revenue) * 100
-                    insights.append(f"Top 5 products account for {concentration:.1f}% of total revenue")
-        
+        if ctx.product_vals is not None:
+            top_product = ctx.product_labels[0]
+            top_revenue = ctx.product_vals[0]
+            insights.append(f"Star product '{top_product}' generates ${top_revenue:,.2f}")
+
+            if ctx.product_vals.size > 5:
+                top_5_revenue = ctx.product_vals[:5].sum()
+                total_revenue = ctx.product_vals.sum()
+                concentration = (top_5_revenue / total_revenue) * 100
+                insights.append(f"Top 5 products account for {concentration:.1f}% of total revenue")
+
         return insights
     
-    def _generate_real_estate_insights(self, df, aggregations):
+    @staticmethod
+    def _top_value(series):
+        """
+        Return the most frequent value in a series without sorting.
+
+        Counter.most_common(1) is an O(n) scan, unlike value_counts which
+        sorts every distinct category just to read the first row.
+        """
+        counts = Counter(series.dropna())
+        return counts.most_common(1)[0][0] if counts else None
+
+    def _generate_real_estate_insights(self, df, aggregations, ctx):
         """Generate real estate-specific insights."""
         insights = []
         
         # Price analysis
         if 'sale_price' in df.columns:
-            # Clean price data - convert to numeric, handling strings and invalid values
-            prices = pd.to_numeric(df['sale_price'].astype(str).str.replace(',', '').str.replace(' ', '').str.replace('-', '0'), errors='coerce')
+            if pd.api.types.is_numeric_dtype(df['sale_price']):
+                # Already numeric - skip the string cleanup entirely
+                prices = df['sale_price']
+            else:
+                # Clean price strings with a single compiled-regex pass
+                # instead of chained str.replace calls
+                cleaned = df['sale_price'].astype(str).str.replace(_PRICE_CLEAN_RE, '', regex=True).replace('-', '0')
+                prices = pd.to_numeric(cleaned, errors='coerce')
             prices = prices.replace(0, np.nan).dropna()
             
             if not prices.empty and len(prices) > 0:
@@ -141,39 +260,30 @@ class DataIntelligence:
                     insights.append("High-end properties significantly skew average prices")
         
         # Geographic insights
-        if 'regional' in aggregations:
-            regions = aggregations['regional']
-            if not regions.empty:
-                top_region = regions.iloc[0, 0]
-                if str(top_region) != 'Unknown' and str(top_region) != 'nan':
-                    insights.append(f"Most active market area: {top_region}")
+        if ctx.regional_labels is not None:
+            top_region = ctx.regional_labels[0]
+            if str(top_region) != 'Unknown' and str(top_region) != 'nan':
+                insights.append(f"Most active market area: {top_region}")
         
         # Building type analysis
         building_cols = [col for col in df.columns if 'building' in col.lower() and 'class' in col.lower()]
         if building_cols:
-            building_col = building_cols[0]
-            building_types = df[building_col].value_counts()
-            if not building_types.empty:
-                top_type = building_types.index[0]
-                if str(top_type) != 'Unknown' and str(top_type) != 'nan':
-                    insights.append(f"Most common property type: {top_type}")
-        
+            top_type = self._top_value(df[building_cols[0]])
+            if top_type is not None and str(top_type) != 'Unknown' and str(top_type) != 'nan':
+                insights.append(f"Most common property type: {top_type}")
+
         # Neighborhood analysis
         neighborhood_cols = [col for col in df.columns if 'neighborhood' in col.lower() or 'area' in col.lower()]
         if neighborhood_cols:
-            neighborhood_col = neighborhood_cols[0]
-            neighborhoods = df[neighborhood_col].value_counts().head(3)
-            if not neighborhoods.empty:
-                top_neighborhood = neighborhoods.index[0]
-                if str(top_neighborhood) != 'Unknown':
-                    insights.append(f"Most active neighborhood: {top_neighborhood}")
-        
+            top_neighborhood = self._top_value(df[neighborhood_cols[0]])
+            if top_neighborhood is not None and str(top_neighborhood) != 'Unknown':
+                insights.append(f"Most active neighborhood: {top_neighborhood}")
+
         # Borough analysis for NYC data
         if 'borough' in [col.lower() for col in df.columns]:
             borough_col = next(col for col in df.columns if col.lower() == 'borough')
-            boroughs = df[borough_col].value_counts()
-            if not boroughs.empty:
-                top_borough = boroughs.index[0]
+            top_borough = self._top_value(df[borough_col])
+            if top_borough is not None:
                 borough_names = {1: 'Manhattan', 2: 'Bronx', 3: 'Brooklyn', 4: 'Queens', 5: 'Staten Island'}
                 borough_name = borough_names.get(top_borough, top_borough)
                 insights.append(f"Most active borough: {borough_name}")
@@ -214,16 +324,21 @@ class DataIntelligence:
         elif missing_percent > 20:
             insights.append("Data quality concern - significant missing values detected")
         
-        # Numeric column analysis
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols[:3]:  # Analyze first 3 numeric columns
-            if col in df.columns:
-                values = df[col].dropna()
-                if not values.empty:
-                    skewness = values.skew()
-                    if abs(skewness) > 2:
-                        distribution = "heavily skewed" if abs(skewness) > 3 else "moderately skewed"
-                        insights.append(f"{col.title()} data is {distribution} - consider log transformation")
+        # Numeric column analysis (first 3 numeric columns)
+        numeric_cols = df.select_dtypes(include=[np.number]).columns[:3]
+        if len(numeric_cols) > 0:
+            if _scipy_skew is not None:
+                # One float32 pass over the block; scipy skips NaNs
+                # in-kernel without per-column dropna copies
+                arr = df[numeric_cols].to_numpy(dtype=np.float32)
+                skews = np.atleast_1d(_scipy_skew(arr, axis=0, bias=False, nan_policy='omit'))
+            else:
+                skews = [df[col].skew() for col in numeric_cols]
+
+            for col, skewness in zip(numeric_cols, skews):
+                if abs(skewness) > 2:
+                    distribution = "heavily skewed" if abs(skewness) > 3 else "moderately skewed"
+                    insights.append(f"{col.title()} data is {distribution} - consider log transformation")
         
         return insights
     
@@ -234,46 +349,68 @@ class DataIntelligence:
         if len(numeric_df.columns) < 2:
             return []
         
+        # Compute the matrix in one numpy call and only inspect the upper
+        # triangle - it is symmetric and self-correlations are never
+        # interesting (float32 halves the bandwidth of the pass).
+        # corrcoef has no missing-value handling and a single NaN
+        # poisons every pair its column appears in - and clean_data
+        # deliberately keeps NaN in price columns - so restrict the
+        # fast path to complete rows and fall back to pandas'
+        # pairwise-complete corr when too few remain
+        arr = numeric_df.to_numpy(dtype=np.float32, copy=False)
+        complete = ~np.isnan(arr).any(axis=1)
+        if int(complete.sum()) >= 2:
+            corr_matrix = np.corrcoef(arr[complete], rowvar=False)
+        else:
+            corr_matrix = numeric_df.corr().to_numpy()
+
+        rows, cols = np.triu_indices(corr_matrix.shape[0], k=1)
+        upper_vals = corr_matrix[rows, cols]
+        strong = np.abs(upper_vals) > 0.7  # Strong correlation threshold
+
         correlations = []
-        corr_matrix = numeric_df.corr()
-        
-        # Find strong correlations (excluding self-correlations)
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                corr_val = corr_matrix.iloc[i, j]
-                if abs(corr_val) > 0.7:  # Strong correlation threshold
-                    col1 = corr_matrix.columns[i]
-                    col2 = corr_matrix.columns[j]
-                    direction = "positively" if corr_val > 0 else "negatively"
-                    correlations.append({
-                        'column1': col1,
-                        'column2': col2,
-                        'correlation': corr_val,
-                        'description': f"{col1} and {col2} are strongly {direction} correlated ({corr_val:.3f})"
-                    })
-        
+        column_names = numeric_df.columns
+        for i, j, corr_val in zip(rows[strong], cols[strong], upper_vals[strong]):
+            col1 = column_names[i]
+            col2 = column_names[j]
+            corr_val = float(corr_val)
+            direction = "positively" if corr_val > 0 else "negatively"
+            correlations.append({
+                'column1': col1,
+                'column2': col2,
+                'correlation': corr_val,
+                'description': f"{col1} and {col2} are strongly {direction} correlated ({corr_val:.3f})"
+            })
+
         return correlations
     
     def detect_outliers(self, df, columns=None):
         """Detect outliers using IQR method."""
         if columns is None:
             columns = df.select_dtypes(include=[np.number]).columns
-        
+
+        columns = [col for col in columns if col in df.columns]
+        if not columns:
+            return {}
+
+        # Pull the numeric block into one column-major float32 array so a
+        # single nanpercentile call yields every quartile at once, instead
+        # of two pandas quantile dispatches per column
+        arr = np.asfortranarray(df[columns].to_numpy(dtype=np.float32))
+        q1, q3 = np.nanpercentile(arr, [25, 75], axis=0)
+        iqr = q3 - q1
+        lower_bounds = q1 - 1.5 * iqr
+        upper_bounds = q3 + 1.5 * iqr
+
+        with np.errstate(invalid='ignore'):
+            counts = ((arr < lower_bounds) | (arr > upper_bounds)).sum(axis=0)
+
         outlier_info = {}
-        
-        for col in columns:
-            if col in df.columns:
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-                outlier_info[col] = {
-                    'count': len(outliers),
-                    'percentage': (len(outliers) / len(df)) * 100,
-                    'bounds': (lower_bound, upper_bound)
-                }
-        
+        for idx, col in enumerate(columns):
+            outlier_info[col] = {
+                'count': int(counts[idx]),
+                'percentage': (int(counts[idx]) / len(df)) * 100,
+                'bounds': (float(lower_bounds[idx]), float(upper_bounds[idx]))
+            }
+
         return outlier_info
\ No newline at end of file
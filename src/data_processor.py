@@ -3,11 +3,99 @@ Data Processing Module
 Handles data loading, cleaning, validation, and aggregation for the report generator.
 """
 
+import os
+import re
+from dataclasses import dataclass, field
+
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from config import Config
 
+try:
+    import pyarrow  # noqa: F401 - presence enables the multithreaded CSV engine
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _parse_money_kernel(buf, offsets, out):
+        """
+        Parse concatenated UTF-8 price strings into floats.
+
+        buf holds every string back to back; offsets[i]:offsets[i+1]
+        delimits string i. Digits accumulate, '.' starts the fractional
+        part, and the separators the regex fallback strips (',',
+        whitespace, '-') are skipped. Any other byte marks the whole
+        string as non-numeric - 'C2' or 'R4' are building-class codes,
+        not prices - so it comes out NaN exactly like
+        to_numeric(errors='coerce') after the regex strip.
+        """
+        for i in range(out.size):
+            value = 0.0
+            divisor = 0.0
+            ndigits = 0
+            valid = True
+            for j in range(offsets[i], offsets[i + 1]):
+                c = buf[j]
+                if 48 <= c <= 57:
+                    if divisor > 0.0:
+                        value += (c - 48) / divisor
+                        divisor *= 10.0
+                    else:
+                        value = value * 10.0 + (c - 48)
+                    ndigits += 1
+                elif c == 46:
+                    divisor = 10.0
+                elif c == 44 or c == 45 or c == 32 or c == 9:
+                    pass  # ',', '-', ' ', tab - stripped by the fallback too
+                else:
+                    valid = False
+                    break
+            out[i] = value if valid and ndigits > 0 else np.nan
+
+# Strips thousands separators, whitespace and placeholder dashes from
+# price strings in a single pass
+_PRICE_STRIP_RE = re.compile(r'[,\s\-]')
+
+# Compiled keyword alternations for column-role detection - one regex
+# search per column name instead of a Python substring test per keyword
+# Standard column names with compiled alias alternations, in priority
+# order; standardize_columns resolves each against the frame with one
+# regex search per column instead of a substring test per alias
+_COLUMN_ALIASES = [
+    ('date', re.compile(r'date|order_date|transaction_date|sale_date')),
+    ('sales', re.compile(r'sales|amount|revenue|total|value|sale_price')),
+    ('product', re.compile(r'product|item|product_name|item_name|building_class_at_present')),
+    ('region', re.compile(r'region|location|area|territory|zip_code')),
+    ('month', re.compile(r'month|month_name|sale_date')),
+    ('quantity', re.compile(r'quantity|qty|units|count|total_units')),
+]
+
+_KEYWORD_RE = {
+    'price': re.compile(r'price|sale', re.I),
+    'monetary': re.compile(r'price|sale|value|amount', re.I),
+    'value': re.compile(r'price|value|amount|cost', re.I),
+    'revenue': re.compile(r'sales|revenue|income', re.I),
+    'excluded': re.compile(r'units|quantity|count|id|year|month|block|lot', re.I),
+    'product': re.compile(r'product|item', re.I),
+    'region': re.compile(r'region|location|area', re.I),
+}
+
+@dataclass
+class ColumnRoles:
+    """Column roles detected once per pipeline run and shared by every step."""
+    price: list = field(default_factory=list)
+    date: list = field(default_factory=list)
+    product: str = None
+    region: str = None
+
 class DataProcessor:
     """Handles all data processing operations including cleaning and aggregation."""
     
@@ -15,89 +103,285 @@ class DataProcessor:
         self.verbose = verbose
         self.config = Config()
     
+    @staticmethod
+    def _sniff_encoding(file_path):
+        """
+        Guess the file encoding from its first 64 KB.
+
+        A single decode attempt on a small prefix replaces whole-file
+        read_csv retries that only fail after decoding everything.
+
+        Args:
+            file_path (str): Path to the CSV file
+
+        Returns:
+            str: 'utf-8' if the prefix decodes cleanly, else 'latin-1'
+        """
+        file_size = os.path.getsize(file_path)
+        sample_size = min(file_size, 65536)
+        with open(file_path, 'rb') as f:
+            sample = f.read(sample_size)
+        try:
+            sample.decode('utf-8')
+            return 'utf-8'
+        except UnicodeDecodeError as exc:
+            # A truncated sample can cut a multi-byte sequence at its
+            # end; an error starting within the last 4 bytes means
+            # truncation, not a genuinely non-UTF-8 file
+            if sample_size < file_size and exc.start >= sample_size - 4:
+                return 'utf-8'
+            return 'latin-1'
+
+    def _load_chunked(self, file_path, encoding):
+        """
+        Read an oversized CSV in fixed-size row chunks.
+
+        Parsing state stays bounded to one chunk at a time, which keeps
+        peak memory during the parse phase flat for files well past the
+        chunk threshold; the cleaned-up concat at the end reuses the
+        chunk blocks instead of re-parsing.
+
+        Args:
+            file_path (str): Path to the CSV file
+            encoding (str): File encoding to use
+
+        Returns:
+            pd.DataFrame: Concatenated data
+        """
+        chunks = []
+        with pd.read_csv(file_path, encoding=encoding,
+                         chunksize=self.config.CHUNK_ROWS) as reader:
+            for chunk in reader:
+                chunks.append(chunk)
+                if self.verbose:
+                    print(f"Read chunk of {len(chunk):,} rows")
+        return pd.concat(chunks, ignore_index=True)
+
+    def _load_arrow_stream(self, file_path, encoding):
+        """
+        Stream-read an oversized CSV with the pyarrow incremental reader.
+
+        open_csv parses record batches on background threads while the
+        file is still being read, overlapping I/O with parsing;
+        self_destruct frees each Arrow batch as it converts so the
+        Arrow and pandas copies never coexist in full.
+
+        Args:
+            file_path (str): Path to the CSV file
+            encoding (str): File encoding to use
+
+        Returns:
+            pd.DataFrame: Loaded data
+        """
+        from pyarrow import csv as pacsv
+
+        read_options = pacsv.ReadOptions(block_size=64 << 20,
+                                         use_threads=True,
+                                         encoding=encoding)
+        with pacsv.open_csv(file_path, read_options=read_options) as reader:
+            table = reader.read_all()
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
     def load_data(self, file_path):
         """
         Load data from CSV file with error handling and validation.
-        
+
         Args:
             file_path (str): Path to the CSV file
-            
+
         Returns:
             pd.DataFrame: Loaded data
         """
         try:
-            # Try different encodings if default fails
-            encodings = ['utf-8', 'latin-1', 'cp1252']
+            # Sniff the encoding once so the common case is a single
+            # read_csv call; the multithreaded pyarrow engine is used
+            # when available
+            encoding = self._sniff_encoding(file_path)
             df = None
-            
-            for encoding in encodings:
-                try:
+
+            try:
+                if os.path.getsize(file_path) > self.config.CHUNK_THRESHOLD_BYTES:
+                    # Too big for a single parse buffer - stream it in
+                    if HAS_PYARROW:
+                        df = self._load_arrow_stream(file_path, encoding)
+                    else:
+                        df = self._load_chunked(file_path, encoding)
+                elif HAS_PYARROW:
+                    df = pd.read_csv(file_path, encoding=encoding, engine='pyarrow')
+                else:
                     df = pd.read_csv(file_path, encoding=encoding)
-                    if self.verbose:
-                        print(f"Successfully loaded data with {encoding} encoding")
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
+                if self.verbose:
+                    print(f"Successfully loaded data with {encoding} encoding")
+            except (UnicodeDecodeError, ValueError):
+                # Sniff missed (or pyarrow balked at the dialect) - fall
+                # back to the exhaustive encoding loop with the default
+                # engine
+                for fallback in ['utf-8', 'latin-1', 'cp1252']:
+                    try:
+                        df = pd.read_csv(file_path, encoding=fallback)
+                        if self.verbose:
+                            print(f"Successfully loaded data with {fallback} encoding")
+                        break
+                    except UnicodeDecodeError:
+                        continue
+
             if df is None:
                 raise ValueError("Unable to read CSV file with any supported encoding")
-            
+
             if self.verbose:
                 print(f"Loaded {len(df)} rows and {len(df.columns)} columns")
                 print(f"Columns: {list(df.columns)}")
-            
+
             return df
-            
+
         except Exception as e:
             raise Exception(f"Error loading data from {file_path}: {str(e)}")
     
-    def clean_data(self, df):
+    @staticmethod
+    def _detect_roles(columns):
+        """
+        Classify columns into pipeline roles with one pass over the names.
+
+        Args:
+            columns (iterable): Column names
+
+        Returns:
+            ColumnRoles: Detected price/date/product/region columns
+        """
+        roles = ColumnRoles()
+        for col in columns:
+            if _KEYWORD_RE['price'].search(col):
+                roles.price.append(col)
+            if 'date' in col.lower():
+                roles.date.append(col)
+            if roles.product is None and _KEYWORD_RE['product'].search(col):
+                roles.product = col
+            if roles.region is None and _KEYWORD_RE['region'].search(col):
+                roles.region = col
+        return roles
+
+    def _parse_prices(self, series):
+        """
+        Convert a price-string column to floats.
+
+        With numba installed, the strings are staged into one contiguous
+        byte buffer plus an offset array and handed to a compiled kernel
+        that walks the bytes directly - no per-row Python string
+        machinery. Otherwise a single compiled-regex strip feeds
+        to_numeric.
+
+        Args:
+            series (pd.Series): Price strings
+
+        Returns:
+            pd.Series: Parsed float values, NaN where no digits appeared
+        """
+        if njit is not None and len(series) > 10000:
+            encoded = series.fillna('').astype(str).str.encode('utf-8')
+            lengths = encoded.str.len().to_numpy(dtype=np.int64)
+            offsets = np.zeros(len(series) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+            out = np.empty(len(series), dtype=np.float64)
+            _parse_money_kernel(buf, offsets, out)
+            return pd.Series(out, index=series.index)
+
+        return pd.to_numeric(series.str.replace(_PRICE_STRIP_RE, '', regex=True),
+                             errors='coerce')
+
+    def clean_data(self, df, roles=None):
         """
         Clean the dataset by handling missing values, duplicates, and data types.
-        
+
         Args:
             df (pd.DataFrame): Raw dataframe
-            
+            roles (ColumnRoles, optional): Precomputed column roles;
+                detected from df when omitted
+
         Returns:
             pd.DataFrame: Cleaned dataframe
         """
         if self.verbose:
             print(f"Starting data cleaning. Initial shape: {df.shape}")
         
-        # Create a copy to avoid modifying original data
-        cleaned_df = df.copy()
+        # Copy-on-write covers the caller: column assignments below never
+        # touch the input frame, so no up-front deep copy is needed
+        cleaned_df = df
         
         # Process full dataset - no sampling limitations
         if self.verbose:
             print(f"Processing full dataset: {len(cleaned_df):,} rows")
         
-        # Enhanced cleaning for real estate data with " - " values
-        for col in cleaned_df.columns:
-            if cleaned_df[col].dtype == 'object':
-                # Replace " - " and similar null indicators with proper NaN
-                cleaned_df[col] = cleaned_df[col].replace([' - ', ' -  ', '-', '  ', '', 'N/A'], pd.NA)
+        # Enhanced cleaning for real estate data with " - " values:
+        # one isin scan over the object block replaces a per-column
+        # Series.replace pass for every null indicator
+        object_cols = cleaned_df.select_dtypes(include='object').columns
+        if len(object_cols) > 0:
+            object_block = cleaned_df[object_cols]
+            null_mask = object_block.isin([' - ', ' -  ', '-', '  ', '', 'N/A'])
+            if null_mask.to_numpy().any():
+                cleaned_df[object_cols] = object_block.mask(null_mask)
         
         # Handle missing values
         initial_rows = len(cleaned_df)
         
         # Special handling for price columns in real estate data
-        price_columns = [col for col in cleaned_df.columns if any(keyword in col.lower() for keyword in ['price', 'sale'])]
-        for col in price_columns:
-            if col in cleaned_df.columns and cleaned_df[col].dtype == 'object':
-                # Convert price strings to numeric, handling commas and invalid values
-                cleaned_df[col] = pd.to_numeric(
-                    cleaned_df[col].astype(str).str.replace(',', '').str.replace(' ', '').str.replace('-', '').replace('', '0'),
-                    errors='coerce'
-                )
+        if roles is None:
+            roles = self._detect_roles(cleaned_df.columns)
+        for col in roles.price:
+            if (col in cleaned_df.columns
+                    and not pd.api.types.is_numeric_dtype(cleaned_df[col])
+                    and not pd.api.types.is_datetime64_any_dtype(cleaned_df[col])):
+                # Convert price strings to numeric; strings with no
+                # digits come out as NaN, which the price branch below
+                # explicitly wants
+                cleaned_df[col] = self._parse_prices(cleaned_df[col])
                 if self.verbose:
                     print(f"Converted {col} to numeric (price column)")
         
+        # Remove duplicates before any imputation - fills can make
+        # genuinely distinct rows identical. The key subset is only a
+        # cheap pre-filter, not proof of duplication: distinct sales can
+        # legitimately share block/lot/date (co-op and multi-unit
+        # closings), so rows it flags are dropped only when they also
+        # match on every non-autonumber column. The expensive full
+        # comparison then runs on the flagged rows alone instead of the
+        # whole frame
+        duplicates_before = len(cleaned_df)
+        dedup_keys = [col for col in self.config.DEDUP_KEYS if col in cleaned_df.columns]
+        if len(dedup_keys) >= 2:
+            candidates = cleaned_df.duplicated(subset=dedup_keys, keep=False)
+            if candidates.any():
+                # Autonumber columns differ on every row and would mask
+                # genuine duplicates; the c engine names headerless ones
+                # 'unnamed: n' while pyarrow leaves the name empty
+                value_cols = [col for col in cleaned_df.columns
+                              if col and not col.startswith('unnamed')] or list(cleaned_df.columns)
+                dup_rows = cleaned_df.loc[candidates].duplicated(subset=value_cols,
+                                                                 keep='first')
+                cleaned_df = cleaned_df.drop(index=dup_rows.index[dup_rows])
+                cleaned_df = cleaned_df.reset_index(drop=True)
+            if self.verbose:
+                print(f"Deduplicated on key columns: {dedup_keys}")
+        else:
+            cleaned_df = cleaned_df.drop_duplicates(ignore_index=True)
+        duplicates_removed = duplicates_before - len(cleaned_df)
+
+        # Count nulls for every column in one vectorized pass instead of
+        # an isnull().sum() scan per column in the loops below
+        null_counts = cleaned_df.isna().sum()
+
+        # Collect every fill value first, then apply them in a single
+        # DataFrame.fillna call - one BlockManager rebuild instead of a
+        # Series.fillna dispatch (and frame copy) per column
+        fill_map = {}
+
         # For numeric columns, handle missing values intelligently
         numeric_columns = cleaned_df.select_dtypes(include=[np.number]).columns
         for col in numeric_columns:
-            if cleaned_df[col].isnull().sum() > 0:
+            if null_counts[col] > 0:
                 # For price columns, don't fill with median - keep as NaN for proper exclusion
-                if any(keyword in col.lower() for keyword in ['price', 'sale', 'value', 'amount']):
+                if _KEYWORD_RE['monetary'].search(col):
                     if self.verbose:
                         print(f"Keeping {col} missing values as NaN for accurate calculations (preserves data integrity)")
                 else:
@@ -107,28 +391,31 @@ class DataProcessor:
                         median_val = cleaned_df[col].mean()
                         if pd.isna(median_val):
                             median_val = 0
-                    cleaned_df = cleaned_df.copy()
-                    cleaned_df[col] = cleaned_df[col].fillna(median_val)
+                    fill_map[col] = median_val
                     if self.verbose:
                         print(f"Filled {col} missing values with median: {median_val:.2f}")
-        
+
         # For categorical columns, fill with mode or 'Unknown'
         categorical_columns = cleaned_df.select_dtypes(include=['object']).columns
         for col in categorical_columns:
-            if cleaned_df[col].isnull().sum() > 0:
-                if not cleaned_df[col].mode().empty:
-                    mode_val = cleaned_df[col].mode()[0]
-                    cleaned_df[col] = cleaned_df[col].fillna(mode_val)
-                else:
-                    cleaned_df[col].fillna('Unknown', inplace=True)
+            if null_counts[col] > 0:
+                mode = cleaned_df[col].mode()
+                fill_map[col] = mode[0] if not mode.empty else 'Unknown'
                 if self.verbose:
                     print(f"Filled {col} missing values")
-        
-        # Remove duplicates
-        duplicates_before = len(cleaned_df)
-        cleaned_df.drop_duplicates(inplace=True)
-        duplicates_removed = duplicates_before - len(cleaned_df)
-        
+
+        if fill_map:
+            cleaned_df = cleaned_df.fillna(fill_map)
+
+        # Low-cardinality string columns (neighborhoods, building
+        # classes, ...) become categoricals: integer codes instead of
+        # per-row string objects, so downstream groupbys hash small ints
+        for col in cleaned_df.select_dtypes(include='object').columns:
+            if cleaned_df[col].nunique(dropna=True) < min(len(cleaned_df) * 0.5, 10000):
+                cleaned_df[col] = cleaned_df[col].astype('category')
+                if self.verbose:
+                    print(f"Converted {col} to categorical dtype")
+
         if self.verbose:
             print(f"Removed {duplicates_removed} duplicate rows")
             print(f"Final cleaned shape: {cleaned_df.shape}")
@@ -145,86 +432,85 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Dataframe with standardized columns
         """
-        standardized_df = df.copy()
-        
-        # Common column name mappings
-        column_mappings = {
-            'date': ['date', 'order_date', 'transaction_date', 'sale_date'],
-            'sales': ['sales', 'amount', 'revenue', 'total', 'value','sale_price'],
-            'product': ['product', 'item', 'product_name', 'item_name','building_class_at_present'],
-            'region': ['region', 'location', 'area', 'territory','zip_code'],
-            'month': ['month', 'month_name','sale_date'],
-            'quantity': ['quantity', 'qty', 'units', 'count','total_units']
-        }
-        
         # Normalize column names (lowercase, remove spaces)
-        standardized_df.columns = [col.lower().strip().replace(' ', '_') for col in standardized_df.columns]
-        
-        # Try to identify and standardize key columns
-        for standard_name, possible_names in column_mappings.items():
-            for col in standardized_df.columns:
-                if any(possible in col.lower() for possible in possible_names):
-                    if standard_name not in standardized_df.columns:
-                        standardized_df = standardized_df.rename(columns={col: standard_name})
-                        if self.verbose:
-                            print(f"Standardized column '{col}' to '{standard_name}'")
-                        break
-        
-        return standardized_df
+        normalized = {col: col.lower().strip().replace(' ', '_') for col in df.columns}
+
+        # Resolve each standard name to the first matching column;
+        # 'taken' tracks names that are already present or claimed so
+        # priority follows the alias order
+        rename_map = {}
+        taken = set(normalized.values())
+        for standard_name, alias_re in _COLUMN_ALIASES:
+            if standard_name in taken:
+                continue
+            for col in normalized.values():
+                if col not in rename_map and alias_re.search(col):
+                    rename_map[col] = standard_name
+                    taken.add(standard_name)
+                    if self.verbose:
+                        print(f"Standardized column '{col}' to '{standard_name}'")
+                    break
+
+        # One composed rename rewrites only the axis labels; the data
+        # blocks are shared with the input frame under copy-on-write
+        # instead of being deep-copied just to change column names
+        return df.rename(columns={orig: rename_map.get(norm, norm)
+                                  for orig, norm in normalized.items()})
     
-    def parse_dates(self, df):
+    def parse_dates(self, df, roles=None):
         """
         Parse and standardize date columns.
-        
+
         Args:
             df (pd.DataFrame): Input dataframe
-            
+            roles (ColumnRoles, optional): Precomputed column roles;
+                detected from df when omitted
+
         Returns:
             pd.DataFrame: Dataframe with parsed dates
         """
-        date_df = df.copy()
-        
-        # Common date column names
-        date_columns = [col for col in date_df.columns if 'date' in col.lower()]
-        
-        for col in date_columns:
-            try:
-                date_df[col] = pd.to_datetime(date_df[col], errors='coerce')
+        # Column assignments trigger copy-on-write, so the input frame is
+        # safe without duplicating every block first
+        date_df = df
+
+        if roles is None:
+            roles = self._detect_roles(date_df.columns)
+
+        for col in roles.date:
+            # Skip columns that are already datetime; for the rest,
+            # cache=True hashes distinct values so repeat-heavy columns
+            # (thousands of rows per distinct date) parse each date once
+            if not pd.api.types.is_datetime64_any_dtype(date_df[col]):
+                date_df[col] = pd.to_datetime(date_df[col], errors='coerce',
+                                              format='mixed', cache=True)
                 if self.verbose:
                     print(f"Parsed {col} as datetime")
-                
-                # Create additional time-based columns for analysis
-                if col == 'date' or 'date' in col.lower():
-                    date_df['year'] = date_df[col].dt.year
-                    date_df['month'] = date_df[col].dt.month
-                    date_df['month_name'] = date_df[col].dt.month_name()
-                    date_df['quarter'] = date_df[col].dt.quarter
-                    
-            except Exception as e:
-                if self.verbose:
-                    print(f"Could not parse {col} as date: {e}")
-        
+
         return date_df
     
-    def aggregate_data(self, df):
+    def aggregate_data(self, df, roles=None):
         """
         Create various data aggregations for reporting.
-        
+
         Args:
             df (pd.DataFrame): Cleaned dataframe
-            
+            roles (ColumnRoles, optional): Precomputed column roles;
+                detected from df when omitted
+
         Returns:
             dict: Dictionary containing various aggregated datasets
         """
         aggregations = {}
+
+        if roles is None:
+            roles = self._detect_roles(df.columns)
         
         # Smart sales column detection - prioritize price/value columns over quantity
         sales_col = None
         
         # Priority 1: Look for price/value columns first (better for real estate)
-        price_keywords = ['price', 'value', 'amount', 'cost']
         for col in df.columns:
-            if any(keyword in col.lower() for keyword in price_keywords):
+            if _KEYWORD_RE['value'].search(col):
                 if pd.api.types.is_numeric_dtype(df[col]):
                     sales_col = col
                     if self.verbose:
@@ -233,9 +519,8 @@ class DataProcessor:
         
         # Priority 2: Look for revenue/sales columns
         if sales_col is None:
-            revenue_keywords = ['sales', 'revenue', 'income']
             for col in df.columns:
-                if any(keyword in col.lower() for keyword in revenue_keywords):
+                if _KEYWORD_RE['revenue'].search(col):
                     if pd.api.types.is_numeric_dtype(df[col]):
                         sales_col = col
                         if self.verbose:
@@ -246,8 +531,7 @@ class DataProcessor:
         if sales_col is None:
             numeric_cols = df.select_dtypes(include=[np.number]).columns
             # Filter out unit/quantity columns
-            excluded_keywords = ['units', 'quantity', 'count', 'id', 'year', 'month', 'block', 'lot']
-            meaningful_cols = [col for col in numeric_cols if not any(keyword in col.lower() for keyword in excluded_keywords)]
+            meaningful_cols = [col for col in numeric_cols if not _KEYWORD_RE['excluded'].search(col)]
             
             if len(meaningful_cols) > 0:
                 sales_col = meaningful_cols[0]
@@ -259,45 +543,100 @@ class DataProcessor:
                     print(f"Fallback: Using {sales_col} as sales column")
         
         if sales_col:
-            # Create a filtered dataset with only valid sales for aggregations
-            valid_sales_df = df[df[sales_col].notna() & (df[sales_col] > 0)].copy()
-            
+            # Create a filtered dataset with only valid sales for
+            # aggregations; gt(0) treats NaN as False so one comparison
+            # replaces the notna-AND-positive double mask, and the
+            # result is only ever read (groupby/sum/mean), so no
+            # defensive copy of the filtered rows is needed
+            valid_sales_df = df.loc[df[sales_col].gt(0)]
+
             if self.verbose:
                 print(f"Using {len(valid_sales_df):,} valid sales records (out of {len(df):,} total) for accurate aggregations")
-            
-            # Monthly aggregation with valid sales only
-            if 'month_name' in valid_sales_df.columns and len(valid_sales_df) > 0:
-                monthly_agg = valid_sales_df.groupby('month_name')[sales_col].agg(['sum', 'count', 'mean']).reset_index()
+
+            def _compact(agg_df):
+                # Money columns are displayed to 2 decimals; with pyarrow
+                # installed, store them as decimal128(18,2) - half the
+                # width of float64 and exact cents, making round(2)
+                # redundant. Without it, float64 + round stays: float32
+                # cannot represent dollar totals at the magnitudes seen
+                # in real-estate data without losing cents.
+                if not HAS_PYARROW:
+                    return agg_df.round(2)
+                money_cols = agg_df.select_dtypes(include='float').columns
+                agg_df[money_cols] = agg_df[money_cols].astype(
+                    pd.ArrowDtype(pyarrow.decimal128(18, 2)))
+                return agg_df
+
+            # With pyarrow installed, stage the needed columns into one
+            # Arrow table shared by all three groupbys - Arrow's hash
+            # aggregation is multithreaded and the column buffers are
+            # reused without copies across the group_by calls
+            arrow_tbl = None
+            if HAS_PYARROW and len(valid_sales_df) > 0:
+                group_keys = [key for key in (roles.product, roles.region)
+                              if key and key in valid_sales_df.columns]
+                try:
+                    arrow_tbl = pyarrow.Table.from_pandas(
+                        valid_sales_df[group_keys + [sales_col]],
+                        preserve_index=False)
+                except Exception:
+                    arrow_tbl = None
+
+            def _agg_by(key):
+                # Shared sum/count/mean aggregation per key column;
+                # sort=False skips an ordering pass the callers either
+                # override with sort_values or do not care about, and
+                # as_index=False returns flat columns directly instead
+                # of a reset_index round-trip
+                if arrow_tbl is not None:
+                    res = (arrow_tbl.group_by(key)
+                           .aggregate([(sales_col, 'sum'),
+                                       (sales_col, 'count'),
+                                       (sales_col, 'mean')])
+                           .to_pandas())
+                    # Callers rename positionally: key first, then the
+                    # sum/count/mean columns
+                    return res[[key, f'{sales_col}_sum',
+                                f'{sales_col}_count', f'{sales_col}_mean']]
+                return (valid_sales_df
+                        .groupby(key, observed=True, sort=False, as_index=False)[sales_col]
+                        .agg(['sum', 'count', 'mean']))
+
+            # Monthly aggregation straight off the datetime column -
+            # month-start buckets come out chronologically ordered, and
+            # only the small aggregated result gets formatted to names
+            date_col = next((col for col in roles.date
+                             if col in valid_sales_df.columns
+                             and pd.api.types.is_datetime64_any_dtype(valid_sales_df[col])),
+                            None)
+            if date_col and len(valid_sales_df) > 0:
+                monthly_agg = (valid_sales_df
+                               .groupby(pd.Grouper(key=date_col, freq='MS'))[sales_col]
+                               .agg(['sum', 'count', 'mean'])
+                               .reset_index())
+                monthly_agg[date_col] = monthly_agg[date_col].dt.strftime('%B')
                 monthly_agg.columns = ['Month', 'Total_Sales', 'Transaction_Count', 'Average_Sale']
-                monthly_agg = monthly_agg.round(2)
+                monthly_agg = _compact(monthly_agg)
                 aggregations['monthly'] = monthly_agg
-            
+
             # Product aggregation
-            product_col = None
-            for col in df.columns:
-                if any(keyword in col.lower() for keyword in ['product', 'item']):
-                    product_col = col
-                    break
-            
+            product_col = roles.product
+
             if product_col and len(valid_sales_df) > 0:
-                product_agg = valid_sales_df.groupby(product_col)[sales_col].agg(['sum', 'count', 'mean']).reset_index()
+                product_agg = _agg_by(product_col)
                 product_agg.columns = ['Product', 'Total_Sales', 'Units_Sold', 'Average_Price']
                 product_agg = product_agg.sort_values('Total_Sales', ascending=False).head(20)
-                product_agg = product_agg.round(2)
+                product_agg = _compact(product_agg)
                 aggregations['product'] = product_agg
-            
+
             # Regional aggregation with valid sales only
-            region_col = None
-            for col in valid_sales_df.columns:
-                if any(keyword in col.lower() for keyword in ['region', 'location', 'area']):
-                    region_col = col
-                    break
-            
+            region_col = roles.region
+
             if region_col and len(valid_sales_df) > 0:
-                region_agg = valid_sales_df.groupby(region_col)[sales_col].agg(['sum', 'count', 'mean']).reset_index()
+                region_agg = _agg_by(region_col)
                 region_agg.columns = ['Region', 'Total_Sales', 'Transaction_Count', 'Average_Sale']
                 region_agg = region_agg.sort_values('Total_Sales', ascending=False)
-                region_agg = region_agg.round(2)
+                region_agg = _compact(region_agg)
                 aggregations['regional'] = region_agg
         
         # Summary statistics
@@ -341,15 +680,19 @@ class DataProcessor:
         """
         # Step 1: Standardize columns
         standardized_data = self.standardize_columns(raw_data)
-        
+
+        # Detect column roles once on the standardized names; every
+        # later step reuses the same mapping instead of rescanning
+        roles = self._detect_roles(standardized_data.columns)
+
         # Step 2: Parse dates
-        date_parsed_data = self.parse_dates(standardized_data)
-        
+        date_parsed_data = self.parse_dates(standardized_data, roles)
+
         # Step 3: Clean data
-        cleaned_data = self.clean_data(date_parsed_data)
-        
+        cleaned_data = self.clean_data(date_parsed_data, roles)
+
         # Step 4: Generate aggregations
-        aggregations = self.aggregate_data(cleaned_data)
+        aggregations = self.aggregate_data(cleaned_data, roles)
         
         # Prepare final processed data structure
         processed_data = {